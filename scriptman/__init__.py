@@ -55,20 +55,54 @@ For detailed documentation, examples, and advanced usage, please refer to the
 
 # Import Supporting Modules
 import atexit
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-# Import all relevant modules
-from scriptman._cli import CLIHandler
-from scriptman._csv import CSVHandler
-from scriptman._database import DatabaseHandler
+# Import the lightweight modules needed at import time
 from scriptman._directories import DirectoryHandler
-from scriptman._etl import ETLHandler
 from scriptman._logs import LogHandler, LogLevel
 from scriptman._maintenance import MaintenanceHandler
-from scriptman._scripts import ScriptsHandler
-from scriptman._selenium import SeleniumHandler
-from scriptman._selenium_interactions import SeleniumInteraction
 from scriptman._settings import SBI, Settings
 
+if TYPE_CHECKING:
+    from scriptman._cli import CLIHandler
+    from scriptman._csv import CSVHandler
+    from scriptman._database import DatabaseHandler
+    from scriptman._etl import ETLHandler
+    from scriptman._scripts import ScriptsHandler
+    from scriptman._selenium import SeleniumHandler
+    from scriptman._selenium_interactions import SeleniumInteraction
+
+# Handlers imported the first time they are accessed, since their modules
+# pull in heavy third-party packages (pandas, pyodbc, selenium)
+_LAZY_IMPORTS: dict[str, str] = {
+    "CLIHandler": "scriptman._cli",
+    "CSVHandler": "scriptman._csv",
+    "DatabaseHandler": "scriptman._database",
+    "ETLHandler": "scriptman._etl",
+    "ScriptsHandler": "scriptman._scripts",
+    "SeleniumHandler": "scriptman._selenium",
+    "SeleniumInteraction": "scriptman._selenium_interactions",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the lazily loaded handlers on first access.
+
+    Args:
+        name (str): The name of the attribute being accessed.
+
+    Returns:
+        Any: The requested handler.
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
 # Define the available objects for the package
 __all__: list[str] = [
     "CLIHandler",
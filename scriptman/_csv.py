@@ -34,6 +34,7 @@ For detailed documentation and examples, please refer to the package
 documentation.
 """
 
+import os
 from glob import glob
 from typing import List, Optional, Union
 
@@ -152,6 +153,4 @@ class CSVHandler:
         Returns:
             None
         """
-        import os
-
         os.remove(csv_file_path)
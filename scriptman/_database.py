@@ -338,11 +338,9 @@ class DatabaseHandler:
             return False
         cursor = self._connection.cursor()
         try:
-            query = f"SELECT COUNT(*) FROM [{table_name}];"
+            query = f"SELECT TOP 1 1 FROM [{table_name}];"
             cursor.execute(query)
-            fetched = cursor.fetchone()
-            count = fetched[0] if fetched is not None else 0
-            return count > 0
+            return cursor.fetchone() is not None
         except Exception:
             return False
         finally:
@@ -65,6 +65,22 @@ from tqdm import tqdm
 from scriptman._csv import CSVHandler
 from scriptman._database import DatabaseHandler
 from scriptman._logs import LogHandler, LogLevel
+from scriptman._settings import Settings
+
+
+def _nan_to_none(value: float) -> Optional[float]:
+    """
+    Replace a 'nan' value with None.
+    """
+    return None if math.isnan(value) else value
+
+
+# Converters used when preparing values for the database, keyed by exact type
+VALUE_CONVERTERS: Dict[type, Callable[[Any], Any]] = {
+    list: json.dumps,
+    dict: json.dumps,
+    float: _nan_to_none,
+}
 
 
 class ETLHandler:
@@ -293,14 +309,13 @@ class ETLHandler:
         self._force_nvarchar = force_nvarchar
         self._db = DatabaseHandler(db_connection_string)
         self._table_exists = self._db.table_exists(self._table)
-        self._records_exist = self._db.table_has_records(self._table)
 
         if (
             not keys
             or not self._table_exists
-            or not self._records_exist
             or truncate
             or recreate
+            or not self._db.table_has_records(self._table)
         ):
             return self._insert(truncate, recreate, bulk_execute, batch_size)
         else:
@@ -344,10 +359,9 @@ class ETLHandler:
                 "Bulk Query Execution Failed. Executing single queries...",
                 LogLevel.WARN,
             )
-            for row in tqdm(
-                unit="record(s)",
-                iterable=prepared_data,
-                desc=f"Loading data onto [{self._table}]",
+            for row in self._progress_bar(
+                prepared_data,
+                f"Loading data onto [{self._table}]",
             ):
                 self._db.execute_write_query(insert_query, row)
 
@@ -381,7 +395,11 @@ class ETLHandler:
                     upd_query,
                     keys,
                 )
-                prepared_data = self._prepare_data(keys, True)
+                # Append the keys again for the WHERE NOT EXISTS clause
+                key_count = len(keys)
+                prepared_data = [
+                    row + row[-key_count:] for row in prepared_data
+                ]
                 self._log.message(f"Inserting new data on [{self._table}]...")
                 self._db.execute_many(ins_query, prepared_data, batch_size)
             else:
@@ -395,19 +413,42 @@ class ETLHandler:
             ins_query = self._convert_update_query_to_insert_query(upd_query)
             prepared_data = self._prepare_data(keys)
 
-            for row in tqdm(
-                unit="record(s)",
-                iterable=prepared_data,
-                desc=f"Updating data on [{self._table}]",
+            for row in self._progress_bar(
+                prepared_data,
+                f"Updating data on [{self._table}]",
             ):
                 try:
                     self._db.execute_write_query(upd_query, row, True)
                 except ValueError:
                     self._db.execute_write_query(ins_query, row, True)
 
-    def _prepare_data(
-        self, keys: Optional[List[str]] = None, duplicate_keys: bool = False
-    ) -> List[tuple]:
+    @staticmethod
+    def _progress_bar(rows: List[tuple], description: str) -> tqdm:
+        """
+        Wrap the rows being loaded one at a time in a progress bar.
+
+        The bar is only redrawn about a thousand times over the whole load
+        (and at most every half second), so refreshing it doesn't slow down
+        the row-by-row fallback on large datasets. It is disabled entirely
+        when logs aren't printed to the terminal.
+
+        Args:
+            rows (List[tuple]): The prepared rows to iterate over.
+            description (str): The description shown on the progress bar.
+
+        Returns:
+            tqdm: The progress bar iterating over the rows.
+        """
+        return tqdm(
+            iterable=rows,
+            unit="record(s)",
+            desc=description,
+            mininterval=0.5,
+            miniters=max(1, len(rows) // 1000),
+            disable=not Settings.print_logs_to_terminal,
+        )
+
+    def _prepare_data(self, keys: Optional[List[str]] = None) -> List[tuple]:
         """
         Prepare data for insertion into a database table.
 
@@ -422,44 +463,57 @@ class ETLHandler:
 
         Args:
             keys (Optional[List[str]]): List of keys for updates.
-            duplicate_keys (bool): Whether to additionally duplicate and append
-                the keys to the end of the tuple. Useful for the WHERE NOT
-                EXISTS clause.
 
         Returns:
             List[Tuple]: A list of tuples representing the processed rows ready
                 for insertion.
         """
-        prepared_rows = []
+        if keys is not None:
+            columns = {c: i for i, c in enumerate(self._data.columns)}
+            key_set = set(keys)
+            ordered = [c for c in columns if c not in key_set] + list(keys)
+            positions = [columns[c] for c in ordered]
+            data = self._data.iloc[:, positions]
+        else:
+            data = self._data
 
-        for _, row in self._data.iterrows():
-            processed_row = []
+        # NOTE: Don't use iterrows here, it upcasts mixed int/float rows to
+        # float.
+        prepared_rows = [
+            tuple(self._prepare_value(val) for val in row)
+            for row in data.itertuples(index=False, name=None)
+        ]
 
-            if keys is not None:
-                shifted_values = [row[c] for c in row.index if c not in keys]
-                shifted_values.extend([row[col] for col in keys])
+        return prepared_rows
 
-                if duplicate_keys:
-                    shifted_values.extend([row[col] for col in keys])
+    @staticmethod
+    def _prepare_value(value: Any) -> Any:
+        """
+        Prepare a single value for loading onto the database, converting
+        nested lists and dictionaries to JSON strings and 'nan' values to None.
 
-                processed_row.extend(
-                    json.dumps(val) if isinstance(val, (list, dict)) else val
-                    for val in shifted_values
-                )
-            else:
-                processed_row.extend(
-                    json.dumps(val) if isinstance(val, (list, dict)) else val
-                    for val in row
-                )
+        Plain ints, strings and None are returned straight away. Other values
+        are converted by looking up their exact type first, falling back to
+        isinstance checks only for subclasses (e.g. numpy floats).
 
-            # Replace 'nan' value with None
-            processed_row = tuple(
-                None if isinstance(val, float) and math.isnan(val) else val
-                for val in processed_row
-            )
-            prepared_rows.append(processed_row)
+        Args:
+            value (Any): The value to prepare.
 
-        return prepared_rows
+        Returns:
+            Any: The prepared value.
+        """
+        value_type = type(value)
+        if value_type is int or value_type is str or value is None:
+            return value
+
+        converter = VALUE_CONVERTERS.get(value_type)
+        if converter is not None:
+            return converter(value)
+        if isinstance(value, (list, dict)):
+            return json.dumps(value)
+        if isinstance(value, float):
+            return _nan_to_none(value)
+        return value
 
     def _generate_create_table_query(
         self, table_name: str, pandas_dataset: pd.DataFrame
@@ -657,8 +711,19 @@ class ETLHandler:
         Returns:
             MutableMapping: The flattened dictionary.
         """
-        flat_dict = dict(d)
-        [flat_dict] = pd.json_normalize(flat_dict, sep=sep).to_dict("records")
+        # Mirror pd.json_normalize for a single record: top-level values
+        # first, then the nested dictionaries flattened into prefixed keys.
+        flat_dict = {k: v for k, v in d.items() if not isinstance(v, dict)}
+
+        def flatten(value: Any, key: str) -> None:
+            if isinstance(value, dict):
+                prefix = f"{key}{sep}" if key else ""
+                for nested_key, nested_value in value.items():
+                    flatten(nested_value, f"{prefix}{nested_key}")
+            else:
+                flat_dict[key] = value
+
+        flatten({k: v for k, v in d.items() if isinstance(v, dict)}, "")
         return flat_dict
 
     def _extract_nested_data(
@@ -41,7 +41,11 @@ Methods:
         self,
         filename: str
     ) -> Optional[str]`: Generates a log file path.
-- `_configure_logging(self) -> None`: Configures logging settings.
+- `_configure_logging(
+        self,
+        filename: str,
+        level: LogLevel
+    ) -> None`: Configures the process-wide logging sink once.
 - `_get_log_level(
         self,
         level: LogLevel
@@ -118,10 +122,8 @@ class LogHandler:
         self._name = name.upper().replace(" ", "_")
         self._module = module.upper() if module else None
         self._title = name.title().replace("_", " ")
-        self._logs_dir = DirectoryHandler().logs_dir
         self._description = description or self._title
-        self._file = self._get_log_file(filename)
-        self._configure_logging(level)
+        self._configure_logging(filename, level)
 
     def _get_log_file(self, filename: str) -> Optional[str]:
         """
@@ -136,15 +138,28 @@ class LogHandler:
         """
         if not Settings.log_mode:
             return None
+        logs_dir = DirectoryHandler().logs_dir
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        return rf"{self._logs_dir}\{filename} - {timestamp}.log"
+        return rf"{logs_dir}\{filename} - {timestamp}.log"
 
-    def _configure_logging(self, level: LogLevel) -> None:
+    def _configure_logging(self, filename: str, level: LogLevel) -> None:
         """
         Configures logging to a file.
+
+        The root logger acts as a single sink for the lifetime of the process,
+        so once it has a handler every other LogHandler simply reuses it
+        instead of resolving a new log file (`logging.basicConfig` would
+        ignore it anyway).
+
+        Args:
+            filename (str): The base filename for the log file.
+            level (LogLevel): The logging level.
         """
+        if logging.root.handlers:
+            return
+
         logging.basicConfig(
-            filename=self._file,
+            filename=self._get_log_file(filename),
             level=self._get_log_level(level),
             format="%(asctime)s %(levelname)s:%(message)s",
         )
@@ -199,6 +214,18 @@ class LogHandler:
             print_to_terminal (bool): Whether to print the message to the
                 terminal.
         """
+        log_level = self._get_log_level(level)
+        log_to_file = bool(Settings.log_mode) and logging.root.isEnabledFor(
+            log_level
+        )
+        print_to_terminal = (
+            print_to_terminal and Settings.print_logs_to_terminal
+        )
+
+        # Skip formatting the message when it would not be written anywhere
+        if not (log_to_file or print_to_terminal):
+            return
+
         formatted_message = f"[{self._name}] {message}"
         formatted_message += (
             "\n\t" + ("\n\t".join([f"{k}: {v}" for k, v in details.items()]))
@@ -206,10 +233,10 @@ class LogHandler:
             else ""
         )
 
-        if Settings.log_mode:
-            logging.log(self._get_log_level(level), formatted_message)
+        if log_to_file:
+            logging.log(log_level, formatted_message)
 
-        if print_to_terminal and Settings.print_logs_to_terminal:
+        if print_to_terminal:
             timestamp = datetime.now().strftime("%Y-%m-%d %H-%M-%S")
             print(f"{timestamp} [{level.value}] {formatted_message}")
 
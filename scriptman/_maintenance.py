@@ -70,9 +70,16 @@ class MaintenanceHandler:
         """
         Perform maintenance tasks.
         """
-        folders_to_clean = Settings.maintenance_folders
-        for folder in folders_to_clean:
-            self._remove_pycache_folders(folder)
+        # Skip folders listed twice, or nested inside another listed folder
+        folders_to_clean = sorted(
+            {os.path.abspath(path) for path in Settings.maintenance_folders}
+        )
+        for index, folder in enumerate(folders_to_clean):
+            if not any(
+                folder.startswith(os.path.join(parent, ""))
+                for parent in folders_to_clean[:index]
+            ):
+                self._remove_pycache_folders(folder)
 
         self._remove_custom_driver_folder()
         self._remove_empty_log_files()
@@ -87,6 +94,7 @@ class MaintenanceHandler:
         """
         for root, dirs, filenames in os.walk(directory):
             if "__pycache__" in dirs:
+                dirs.remove("__pycache__")
                 dir_path = os.path.join(root, "__pycache__")
                 try:
                     shutil.rmtree(dir_path)
@@ -28,16 +28,24 @@ documentation.
 
 import os
 import platform
-from typing import Optional
-from zipfile import ZipFile
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from threading import Lock
+from time import monotonic
+from typing import Callable, Dict, Optional, Tuple
+from zipfile import BadZipFile, ZipFile
 
 import requests
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
+from urllib3.util.retry import Retry
 from webdriver_manager.chrome import ChromeDriverManager
 
 from scriptman._directories import DirectoryHandler
 from scriptman._logs import LogHandler, LogLevel
+from scriptman._selenium_chromium import configure_chromium_options
 from scriptman._selenium_interactions import SeleniumInteractionHandler
 from scriptman._settings import Settings
 
@@ -47,11 +55,34 @@ class ChromeApp:
     CHROMEDRIVER = "chromedriver"
 
 
+# Resolves the Chrome for Testing platform identifier for each system. The
+# machine and architecture are only queried on the systems that need them.
+SYSTEM_PLATFORMS: Dict[str, Callable[[], str]] = {
+    "Linux": lambda: "linux64",
+    "Darwin": lambda: (
+        "mac-x64" if platform.machine() == "x86_64" else "mac-arm64"
+    ),
+    "Windows": lambda: (
+        "win32" if platform.architecture()[0] == "32bit" else "win64"
+    ),
+}
+
+# The executable filename for each app, keyed by (app, is_windows)
+APP_EXECUTABLES: Dict[Tuple[str, bool], str] = {
+    (ChromeApp.CHROMEDRIVER, True): "chromedriver.exe",
+    (ChromeApp.CHROMEDRIVER, False): "chromedriver",
+    (ChromeApp.CHROME, True): "chrome.exe",
+    (ChromeApp.CHROME, False): "chrome",
+}
+
+
 class Chrome(SeleniumInteractionHandler):
     """
     Chrome manages the creation of Chrome Selenium WebDriver instances.
     """
 
+    _driver_manager = ChromeDriverManager
+
     def __init__(self) -> None:
         """
         Initialize Chrome instance and set the downloads directory.
@@ -71,12 +102,21 @@ class Chrome(SeleniumInteractionHandler):
             if Settings.selenium_custom_driver:
                 raise ValueError
             options = self._get_chrome_options()
-            service = Service(ChromeDriverManager().install())
+            service = Service(self._get_driver_path())
         except ValueError:
-            cdh = ChromeDownloadHandler()
             chrome_version = Settings.selenium_custom_driver_version
-            chrome_driver = cdh.download(chrome_version)
-            chrome_browser = cdh.download(chrome_version, ChromeApp.CHROME)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                driver_download = executor.submit(
+                    ChromeDownloadHandler().download,
+                    chrome_version,
+                )
+                browser_download = executor.submit(
+                    ChromeDownloadHandler().download,
+                    chrome_version,
+                    ChromeApp.CHROME,
+                )
+                chrome_driver = driver_download.result()
+                chrome_browser = browser_download.result()
             options = self._get_chrome_options(chrome_browser)
             service = Service(executable_path=chrome_driver)
         return webdriver.Chrome(options, service)
@@ -96,37 +136,11 @@ class Chrome(SeleniumInteractionHandler):
             webdriver.ChromeOptions: Chrome WebDriver options.
         """
         options = webdriver.ChromeOptions()
-
-        if chrome_executable_path:
-            options.binary_location = chrome_executable_path
-
-        if Settings.selenium_optimizations and not Settings.debug_mode:
-            optimization_args = [
-                "--headless",
-                "--no-sandbox",
-                "--mute-audio",
-                "--disable-gpu",
-                "--disable-infobars",
-                "--disable-extensions",
-                "--disable-dev-shm-usage",
-                "--disable-notifications",
-                "--disable-setuid-sandbox",
-                "--remote-debugging-port=9222",
-                "--disable-browser-side-navigation",
-                "--disable-blink-features=AutomationControlled",
-            ]
-            [options.add_argument(arg) for arg in optimization_args]
-
-        options.add_experimental_option(
-            "prefs",
-            {
-                "download.directory_upgrade": True,
-                "download.safebrowsing.enabled": True,
-                "download.prompt_for_download": False,
-                "download.default_directory": self._downloads_directory,
-            },
+        configure_chromium_options(
+            options,
+            self._downloads_directory,
+            chrome_executable_path,
         )
-
         return options
 
 
@@ -134,8 +148,25 @@ class ChromeDownloadHandler:
     """
     ChromeDownloadHandler is responsible for downloading and managing the
     Chrome Browser and Driver.
+
+    The known-good versions manifest is fetched at most once per hour and is
+    shared by every instance, indexed by the major Chrome version. Downloads
+    of the same app are serialized, so concurrent Chrome launches never
+    write or extract the same archive at the same time.
     """
 
+    _versions: Optional[Dict[str, dict]] = None
+    _versions_url: Optional[str] = None
+    _versions_fetched_at: float = 0.0
+    _versions_ttl: float = 3600.0
+    _versions_lock: Lock = Lock()
+    _session: Optional[requests.Session] = None
+    _session_lock: Lock = Lock()
+    _app_locks: Dict[str, Lock] = {
+        ChromeApp.CHROME: Lock(),
+        ChromeApp.CHROMEDRIVER: Lock(),
+    }
+
     def __init__(self) -> None:
         """
         Initialize ChromeDownloadHandler instance and set directories.
@@ -159,9 +190,38 @@ class ChromeDownloadHandler:
 
         Returns:
             str: The path to the downloaded ChromeDriver executable.
+
+        Raises:
+            ValueError: If the app is neither Chrome nor ChromeDriver.
         """
+        app_lock = self._app_locks.get(app)
+        if app_lock is None:
+            raise ValueError(f"Invalid Chrome app: {app}")
+
+        with app_lock:
+            return self._download(version, app)
+
+    def _download(
+        self,
+        version: int,
+        app: str = ChromeApp.CHROMEDRIVER,
+    ) -> str:
+        """
+        Download the Chrome Driver/Browser for the specified Chrome version,
+        moving on to the next version if none is available for it.
+
+        Args:
+            version (int): The desired Chrome version.
+            app (str): The application name (default is "chromedriver").
+
+        Returns:
+            str: The path to the downloaded ChromeDriver executable.
+        """
+        app_path = self._get_app_executable_path(app)
+        if os.path.exists(app_path):
+            return app_path
+
         self._log.message(f"Downloading {str(app).title()} v{version}")
-        download_urls = self._fetch_download_urls()
         url = None
 
         if self._tries >= self._max_retries:
@@ -170,10 +230,9 @@ class ChromeDownloadHandler:
             self._tries += 1
 
         try:
-            for version_info in download_urls["versions"]:
-                if version_info["version"].startswith(str(version)):
-                    url = self._get_app_url(version_info, app)
-                    break
+            version_info = self._get_version_info(version)
+            if version_info:
+                url = self._get_app_url(version_info, app)
             if url:
                 return self._get_app_path(url, app)
             else:
@@ -186,19 +245,84 @@ class ChromeDownloadHandler:
                 ),
                 LogLevel.WARN,
             )
-            return self.download(version + 1)
+            return self._download(version + 1, app)
 
-    def _fetch_download_urls(self) -> dict:
+    @classmethod
+    def _fetch_download_urls(cls) -> dict:
         """
         Fetch and return Chrome download URLs.
 
         Returns:
             dict: JSON data containing download URLs.
         """
-        response = requests.get(Settings.selenium_chrome_url)
+        response = cls._get_session().get(Settings.selenium_chrome_url)
         response.raise_for_status()
         return response.json()
 
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """
+        Get the HTTP session shared by all Chrome downloads.
+
+        The session keeps connections to the download server alive between
+        requests and retries transient failures with an exponential backoff,
+        honouring any Retry-After header sent by the server.
+
+        Returns:
+            requests.Session: The shared HTTP session.
+        """
+        if cls._session is None:
+            with cls._session_lock:
+                if cls._session is None:
+                    retries = Retry(
+                        total=5,
+                        backoff_factor=0.5,
+                        status_forcelist=[429, 500, 502, 503, 504],
+                        respect_retry_after_header=True,
+                    )
+                    adapter = HTTPAdapter(
+                        pool_connections=10,
+                        pool_maxsize=10,
+                        max_retries=retries,
+                    )
+                    session = requests.Session()
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    session.headers.update({"Accept-Encoding": "gzip"})
+                    cls._session = session
+        return cls._session
+
+    @classmethod
+    def _get_version_info(cls, version: int) -> Optional[dict]:
+        """
+        Get the version information for the specified major Chrome version.
+
+        The download URLs are only re-fetched once the cached index has
+        expired or the Chrome download URL setting has changed.
+
+        Args:
+            version (int): The desired Chrome version.
+
+        Returns:
+            Optional[dict]: Information about the Chrome version and its
+                downloads, or None if the version is not available.
+        """
+        with cls._versions_lock:
+            versions = cls._versions
+            if (
+                versions is None
+                or cls._versions_url != Settings.selenium_chrome_url
+                or monotonic() - cls._versions_fetched_at > cls._versions_ttl
+            ):
+                versions = {}
+                for version_info in cls._fetch_download_urls()["versions"]:
+                    major_version = version_info["version"].split(".")[0]
+                    versions.setdefault(major_version, version_info)
+                cls._versions = versions
+                cls._versions_url = Settings.selenium_chrome_url
+                cls._versions_fetched_at = monotonic()
+        return versions.get(str(version))
+
     def _get_app_url(
         self,
         version_info: dict,
@@ -221,24 +345,22 @@ class ChromeDownloadHandler:
                 if download_info["platform"] == current_platform:
                     return download_info["url"]
 
-    def _get_system_platform(self) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _get_system_platform() -> str:
         """
         Get the platform identifier based on the current system.
 
+        The result is computed once, since the platform cannot change while
+        the process is running.
+
         Returns:
             str: The platform identifier.
         """
-        system = platform.system()
-        machine = platform.machine()
-        architecture = platform.architecture()[0]
-        system_platform = {
-            "Linux": "linux64",
-            "Darwin": "mac-x64" if machine == "x86_64" else "mac-arm64",
-            "Windows": "win32" if architecture == "32bit" else "win64",
-        }.get(system)
+        system_platform = SYSTEM_PLATFORMS.get(platform.system())
 
         if system_platform:
-            return system_platform
+            return system_platform()
         else:
             raise Exception("Invalid System Platform!")
 
@@ -258,30 +380,33 @@ class ChromeDownloadHandler:
         Returns:
             str: The path to the Chrome Driver/Browser executable.
         """
-        filename = (
-            "chromedriver.exe"
-            if os.name == "nt" and app == "chromedriver"
-            else (
-                "chromedriver"
-                if app == "chromedriver"
-                else (
-                    "chrome"
-                    if not os.name == "nt" and app == "chrome"
-                    else "chrome.exe"
-                )
-            )
-        )
-        path = os.path.join(
-            self._selenium_dir,
-            f"{app}-{self._get_system_platform()}",
-            filename,
-        )
+        path = self._get_app_executable_path(app)
 
         if not os.path.exists(path):
             self._download_and_extract_app(url, app)
 
         return path
 
+    def _get_app_executable_path(
+        self,
+        app: str = ChromeApp.CHROMEDRIVER,
+    ) -> str:
+        """
+        Get the path the Chrome Driver or Browser executable is extracted to.
+
+        Args:
+            app (str): The application name (default is "chromedriver").
+
+        Returns:
+            str: The path to the Chrome Driver/Browser executable.
+        """
+        filename = APP_EXECUTABLES.get((app, os.name == "nt"), "chrome.exe")
+        return os.path.join(
+            self._selenium_dir,
+            f"{app}-{self._get_system_platform()}",
+            filename,
+        )
+
     def _download_and_extract_app(
         self,
         url: str,
@@ -298,22 +423,70 @@ class ChromeDownloadHandler:
         Returns:
             str: Path of the downloaded driver/browser.
         """
-        response = requests.get(url)
-        response.raise_for_status()
         zip_download_path = os.path.join(
             self._selenium_dir,
             f"chrome{'driver' if app == 'chromedriver' else ''}.zip",
         )
 
-        with open(zip_download_path, "wb") as file:
-            file.write(response.content)
-
-        with ZipFile(zip_download_path, "r") as zip_ref:
-            zip_ref.extractall(self._selenium_dir)
+        with self._get_session().get(url, stream=True) as response:
+            response.raise_for_status()
+            expected_size = (
+                None
+                if response.headers.get("Content-Encoding")
+                else response.headers.get("Content-Length")
+            )
+            with open(zip_download_path, "wb") as file:
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    file.write(chunk)
 
-        os.remove(zip_download_path)  # Remove the downloaded zip file
+        self._verify_archive(zip_download_path, expected_size)
 
-        return os.path.join(
+        app_dir = os.path.join(
             self._selenium_dir,
             f"{app}-{self._get_system_platform()}",
         )
+
+        try:
+            with ZipFile(zip_download_path, "r") as zip_ref:
+                zip_ref.extractall(self._selenium_dir)
+        except BadZipFile as error:
+            # Don't leave a partially extracted app behind to be reused
+            shutil.rmtree(app_dir, ignore_errors=True)
+            self._log.message(
+                f"Corrupt download at {zip_download_path}: {error}",
+                LogLevel.ERROR,
+            )
+            raise
+        finally:
+            os.remove(zip_download_path)  # Remove the downloaded zip file
+
+        return app_dir
+
+    def _verify_archive(
+        self,
+        zip_path: str,
+        expected_size: Optional[str] = None,
+    ) -> None:
+        """
+        Verify that a downloaded archive is complete before it is extracted,
+        so that a truncated download is never cached.
+
+        The archive size is checked against the Content-Length of the
+        download (if known), and the archive is deleted if they differ.
+        Corrupt members are caught while the archive is extracted.
+
+        Args:
+            zip_path (str): The path to the downloaded archive.
+            expected_size (str, optional): The Content-Length of the download.
+
+        Raises:
+            BadZipFile: If the archive is incomplete.
+        """
+        size = os.path.getsize(zip_path)
+        if expected_size and size != int(expected_size):
+            os.remove(zip_path)
+            self._log.message(
+                f"Incomplete download at {zip_path} ({size} bytes)",
+                LogLevel.ERROR,
+            )
+            raise BadZipFile(f"Incomplete download ({size} bytes)")
@@ -0,0 +1,91 @@
+"""
+ScriptMan - Chromium WebDriver Options
+
+This module provides the configuration shared by the Chromium based Selenium
+WebDriver instances (Chrome and Edge).
+
+Usage:
+- Import `configure_chromium_options` from this module.
+- Call it with the Chrome/Edge WebDriver options to configure.
+
+Example:
+```python
+from selenium import webdriver
+
+from scriptman._selenium_chromium import configure_chromium_options
+
+options = webdriver.ChromeOptions()
+configure_chromium_options(options, "path/to/downloads")
+```
+
+Constants:
+- `CHROMIUM_OPTIMIZATION_ARGS`: Arguments applied when optimizations are
+    enabled.
+- `CHROMIUM_PREFS`: Download preferences shared by Chromium based browsers.
+
+Functions:
+- `configure_chromium_options`: Applies the options shared by Chromium based
+    browsers (Chrome and Edge).
+
+For detailed documentation and examples, please refer to the package
+documentation.
+"""
+
+from typing import Dict, Optional, Tuple
+
+from selenium.webdriver.chromium.options import ChromiumOptions
+
+from scriptman._settings import Settings
+
+
+# Arguments applied to Chromium based browsers when optimizations are enabled
+CHROMIUM_OPTIMIZATION_ARGS: Tuple[str, ...] = (
+    "--headless",
+    "--no-sandbox",
+    "--mute-audio",
+    "--disable-gpu",
+    "--disable-infobars",
+    "--disable-extensions",
+    "--disable-dev-shm-usage",
+    "--disable-notifications",
+    "--disable-setuid-sandbox",
+    "--remote-debugging-port=9222",
+    "--disable-browser-side-navigation",
+    "--disable-blink-features=AutomationControlled",
+)
+
+# Download preferences shared by Chromium based browsers
+CHROMIUM_PREFS: Dict[str, bool] = {
+    "download.directory_upgrade": True,
+    "download.safebrowsing.enabled": True,
+    "download.prompt_for_download": False,
+}
+
+
+def configure_chromium_options(
+    options: ChromiumOptions,
+    downloads_directory: str,
+    executable_path: Optional[str] = None,
+) -> None:
+    """
+    Apply the configuration shared by the Chromium based browsers (Chrome and
+    Edge) to the given WebDriver options.
+
+    Args:
+        options (ChromiumOptions): The Chrome/Edge WebDriver options to
+            configure.
+        downloads_directory (str): The directory to save downloads to.
+        executable_path (str, optional): Path to the browser binary
+            executable.
+    """
+    if executable_path:
+        options.binary_location = executable_path
+
+    if Settings.selenium_optimizations and not Settings.debug_mode:
+        for arg in CHROMIUM_OPTIMIZATION_ARGS:
+            options.add_argument(arg)
+
+    options.add_experimental_option(
+        "prefs",
+        {**CHROMIUM_PREFS, "download.default_directory": downloads_directory},
+    )
@@ -47,8 +47,8 @@ from selenium.webdriver.edge.service import Service
 from webdriver_manager.microsoft import EdgeChromiumDriverManager
 
 from scriptman._directories import DirectoryHandler
+from scriptman._selenium_chromium import configure_chromium_options
 from scriptman._selenium_interactions import SeleniumInteractionHandler
-from scriptman._settings import Settings
 
 
 class Edge(SeleniumInteractionHandler):
@@ -60,6 +60,8 @@ class Edge(SeleniumInteractionHandler):
         _downloads_directory (str): The directory path for downloads.
     """
 
+    _driver_manager = EdgeChromiumDriverManager
+
     def __init__(self) -> None:
         """
         Initialize Edge instance and set the downloads directory.
@@ -76,7 +78,7 @@ class Edge(SeleniumInteractionHandler):
             webdriver.Edge: An Edge WebDriver instance.
         """
         options = self._get_edge_options()
-        service = Service(EdgeChromiumDriverManager().install())
+        service = Service(self._get_driver_path())
         return webdriver.Edge(options=options, service=service)
 
     def _get_edge_options(
@@ -94,35 +96,9 @@ class Edge(SeleniumInteractionHandler):
             webdriver.EdgeOptions: Edge WebDriver options.
         """
         options = webdriver.EdgeOptions()
-
-        if edge_executable_path:
-            options.binary_location = edge_executable_path
-
-        if Settings.selenium_optimizations and not Settings.debug_mode:
-            optimization_args = [
-                "--headless",
-                "--no-sandbox",
-                "--mute-audio",
-                "--disable-gpu",
-                "--disable-infobars",
-                "--disable-extensions",
-                "--disable-dev-shm-usage",
-                "--disable-notifications",
-                "--disable-setuid-sandbox",
-                "--remote-debugging-port=9222",
-                "--disable-browser-side-navigation",
-                "--disable-blink-features=AutomationControlled",
-            ]
-            [options.add_argument(arg) for arg in optimization_args]
-
-        options.add_experimental_option(
-            "prefs",
-            {
-                "download.directory_upgrade": True,
-                "download.safebrowsing.enabled": True,
-                "download.prompt_for_download": False,
-                "download.default_directory": self._downloads_directory,
-            },
+        configure_chromium_options(
+            options,
+            self._downloads_directory,
+            edge_executable_path,
         )
-
         return options
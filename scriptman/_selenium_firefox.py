@@ -40,7 +40,7 @@ For detailed documentation and examples, please refer to the package
 documentation.
 """
 
-from typing import Optional
+from typing import Dict, Optional, Tuple, Union
 
 from selenium import webdriver
 from selenium.webdriver.firefox.service import Service
@@ -51,6 +51,28 @@ from scriptman._selenium_interactions import SeleniumInteractionHandler
 from scriptman._settings import Settings
 
 
+# Arguments applied to Firefox when optimizations are enabled
+FIREFOX_OPTIMIZATION_ARGS: Tuple[str, ...] = (
+    "--headless",
+    "--disable-infobars",
+    "--disable-extensions",
+    "--disable-notifications",
+    "--remote-debugging-port=9222",
+)
+
+# Download preferences applied to Firefox
+FIREFOX_PREFERENCES: Dict[str, Union[int, str]] = {
+    "browser.download.folderList": 2,
+    "browser.helperApps.neverAsk.saveToDisk": (
+        "application/"
+        "octet-stream,application/"
+        "pdf,text/"
+        "plain,text/"
+        "csv"
+    ),
+}
+
+
 class Firefox(SeleniumInteractionHandler):
     """
     Firefox manages the creation of Firefox Selenium WebDriver instances.
@@ -60,6 +82,8 @@ class Firefox(SeleniumInteractionHandler):
         _downloads_directory (str): The directory path for downloads.
     """
 
+    _driver_manager = GeckoDriverManager
+
     def __init__(self) -> None:
         """
         Initialize Firefox instance and set the downloads directory.
@@ -76,7 +100,7 @@ class Firefox(SeleniumInteractionHandler):
             webdriver.Firefox: A Firefox WebDriver instance.
         """
         options = self._get_firefox_options()
-        service = Service(GeckoDriverManager().install())
+        service = Service(self._get_driver_path())
         return webdriver.Firefox(options=options, service=service)
 
     def _get_firefox_options(
@@ -99,25 +123,12 @@ class Firefox(SeleniumInteractionHandler):
             options.binary_location = firefox_executable_path
 
         if Settings.selenium_optimizations and not Settings.debug_mode:
-            optimization_args = [
-                "--headless",
-                "--disable-infobars",
-                "--disable-extensions",
-                "--disable-notifications",
-                "--remote-debugging-port=9222",
-            ]
-            [options.add_argument(arg) for arg in optimization_args]
-
-        preferences = {
-            "browser.download.folderList": 2,
-            "browser.download.dir": self._downloads_directory,
-            "browser.helperApps.neverAsk.saveToDisk": (
-                "application/"
-                "octet-stream,application/"
-                "pdf,text/"
-                "plain,text/"
-                "csv"
-            ),
-        }
-        [options.set_preference(n, v) for n, v in preferences.items()]
+            for arg in FIREFOX_OPTIMIZATION_ARGS:
+                options.add_argument(arg)
+
+        for name, value in FIREFOX_PREFERENCES.items():
+            options.set_preference(name, value)
+        options.set_preference(
+            "browser.download.dir", self._downloads_directory
+        )
         return options
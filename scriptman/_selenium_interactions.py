@@ -30,6 +30,9 @@ SeleniumInteractionHandler instance.
 ) -> None`: Interact with a web element on the page.
 - `wait_for_downloads_to_finish(self) -> None`: Wait for all downloads to
 finish before continuing.
+- `quit(self) -> None`: Close the WebDriver instance.
+- `_get_driver_path(cls) -> str`: Get the browser's WebDriver executable
+path, installing it with the browser's driver manager when needed.
 
 Enum:
 - `SeleniumInteraction`: Defines possible interaction modes when interacting
@@ -81,6 +84,10 @@ interaction_handler.interact_with_element(
     "//button[@id='example']",
     mode=SeleniumInteraction.CLICK
 )
+
+# Or close the browser as soon as you are done with it
+with SeleniumHandler.chrome() as browser:
+    browser.interact_with_element("//button[@id='example']")
 ```
 
 Enum:
@@ -97,8 +104,11 @@ Enum:
 import os
 import time
 from enum import Enum
+from glob import glob
 from random import uniform
-from typing import Optional, Union
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Optional, Union
 
 from selenium import webdriver
 from selenium.webdriver.common.action_chains import ActionChains
@@ -145,8 +155,24 @@ class SeleniumInteractionHandler:
         _driver (AnyDriver): The Selenium WebDriver instance
             (Chrome or Firefox).
         _downloads_directory (str): The directory path for downloads.
+        _driver_manager (Callable[[], Any]): The webdriver_manager class used
+            by each browser to install its WebDriver.
     """
 
+    _driver_manager: Optional[Callable[[], Any]] = None
+    _driver_path: Optional[str] = None
+    _driver_path_resolved_at: float = 0.0
+    _driver_path_ttl: float = 3600.0
+    _driver_path_lock: Lock = Lock()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Give each browser its own driver path lock, so that installing one
+        browser's driver doesn't hold up launching another browser.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._driver_path_lock = Lock()
+
     def __init__(self, driver: AnyDriver) -> None:
         """
         Initialize the SeleniumInteractionHandler instance with the provided
@@ -253,8 +279,6 @@ class SeleniumInteractionHandler:
             return len(new_files) > 0
 
         def does_file_exist(self) -> bool:
-            from glob import glob
-
             return bool(glob(f"{directory}/{file_name}"))
 
         if file_name:
@@ -262,9 +286,67 @@ class SeleniumInteractionHandler:
         else:
             WebDriverWait(self.driver, 300, 1).until(is_new_file_added)
 
+    @classmethod
+    def _get_driver_path(cls) -> str:
+        """
+        Get the path to the browser's WebDriver executable, installing it with
+        the browser's driver manager when needed.
+
+        The path is cached for each browser class, and looked up again once
+        it is older than an hour or has been removed from disk, so that a
+        browser update is matched with a new driver. Concurrent launches of
+        the same browser wait for a single install instead of racing it.
+
+        Returns:
+            str: The path to the WebDriver executable.
+        """
+        if cls._driver_manager is None:
+            raise NotImplementedError(f"{cls.__name__} has no driver manager")
+
+        def is_stale() -> bool:
+            return (
+                cls._driver_path is None
+                or not os.path.exists(cls._driver_path)
+                or monotonic() - cls._driver_path_resolved_at
+                > cls._driver_path_ttl
+            )
+
+        if is_stale():
+            with cls._driver_path_lock:
+                if is_stale():
+                    cls._driver_path = cls._driver_manager().install()
+                    cls._driver_path_resolved_at = monotonic()
+        return str(cls._driver_path)
+
+    def quit(self) -> None:
+        """
+        Close the WebDriver instance. Calling this more than once is safe.
+        """
+        driver = getattr(self, "driver", None)
+        if driver is not None:
+            del self.driver
+            driver.quit()
+
+    def __enter__(self) -> "SeleniumInteractionHandler":
+        """
+        Use the browser instance as a context manager, so that the WebDriver
+        is closed as soon as the block exits instead of whenever the instance
+        is garbage collected.
+
+        Returns:
+            SeleniumInteractionHandler: The browser instance.
+        """
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """
+        Close the WebDriver instance when leaving the context manager.
+        """
+        self.quit()
+
     def __del__(self) -> None:
         """
         Close the WebDriver instance when the SeleniumInteractionHandler
         instance is deleted.
         """
-        self.driver.quit()
+        self.quit()
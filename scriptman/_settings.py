@@ -105,6 +105,10 @@ Singleton Instance:
 """
 
 import json
+import re
+from os import remove
+from os.path import exists, join
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 
@@ -692,10 +696,6 @@ class SettingsHandler:
             script_name (Optional[str]): The name of the script to clear the
                 lock file for. If not provided, all lock files will be cleared.
         """
-        from os import remove
-        from pathlib import Path
-        from os.path import exists
-
         from scriptman._directories import DirectoryHandler
 
         # Get Scripts Directory
@@ -722,9 +722,6 @@ class SettingsHandler:
         Upgrade the batch file (sm.bat) while maintaining existing variable
         values.
         """
-        import re
-        from os.path import exists, join
-
         from scriptman._batch import BATCH_FILE
 
         existing_version = ""
@@ -0,0 +1,25 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("tqdm")
+pytest.importorskip("pyodbc", exc_type=ImportError)
+pytest.importorskip("chardet")
+
+from scriptman._etl import ETLHandler  # noqa: E402
+
+RECORDS = [
+    {"id": 1, "meta": {"a": 1}, "name": "x"},
+    {"id": 2, "meta": {"a": {"b": 2, "c": [1, 2]}, "d": None}, "tag": "y"},
+    {"meta": {}, "id": 3, "other": {"x": 1}, "list": [{"a": 1}]},
+    {1: "int key", "nested": {2: "int nested key"}},
+    {"a": {"b": {"c": {"d": 4}}}, "z": 0.5},
+]
+
+
+@pytest.mark.parametrize("record", RECORDS)
+def test_flatten_dict_matches_json_normalize(record):
+    handler = ETLHandler.__new__(ETLHandler)
+    [expected] = pd.json_normalize(record, sep="_").to_dict("records")
+    assert list(handler._flatten_dict(record).items()) == list(
+        expected.items()
+    )